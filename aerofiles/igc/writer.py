@@ -692,12 +692,14 @@ class Writer:
         if time is None:
             time = datetime.datetime.utcnow()
 
-        record = self.format_time(time)
-        record += self.format_latitude(latitude)
-        record += self.format_longitude(longitude)
-        record += 'A' if valid else 'V'
-        record += '%05d' % (pressure_alt or 0)
-        record += '%05d' % (gps_alt or 0)
+        record = '%s%s%s%s%05d%05d' % (
+            self.format_time(time),
+            self.format_latitude(latitude),
+            self.format_longitude(longitude),
+            'A' if valid else 'V',
+            pressure_alt or 0,
+            gps_alt or 0,
+        )
 
         if self.fix_extensions or extensions:
             if not (isinstance(extensions, list) and
@@ -708,16 +710,19 @@ class Writer:
                 raise ValueError(
                     'Number of extensions does not match declaration')
 
+            values = [record]
             for type_length, value in zip(self.fix_extensions, extensions):
                 length = type_length[1]
 
                 if isinstance(value, (int, float)):
-                    value = ('%0' + str(length) + 'd') % value
+                    value = '%0*d' % (length, value)
 
                 if len(value) != length:
                     raise ValueError('Extension value has wrong length')
 
-                record += value
+                values.append(value)
+
+            record = ''.join(values)
 
         self.write_record('B', record)
 
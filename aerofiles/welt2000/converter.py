@@ -43,13 +43,37 @@ RE_CLASSIFIERS = [
 ]
 
 
-class Converter:
+def _strip_word_boundary(pattern):
+    if pattern.startswith(r'\b'):
+        return pattern[2:]
+    return pattern
+
+
+# All classifier patterns combined into one alternation so that the waypoint
+# text is scanned only once. Each pattern is wrapped in a named group whose
+# name maps back to the classifier values. Every pattern starts at a word
+# boundary (``^`` followed by a word character implies one), so the leading
+# ``\b`` is hoisted out of the alternation and the regex engine can skip
+# positions inside of words without trying each alternative.
+RE_ALL_CLASSIFIERS = re.compile(r'\b(?:%s)' % '|'.join(
+    '(?P<g%d>%s)' % (i, _strip_word_boundary(regex.pattern))
+    for i, (regex, _) in enumerate(RE_CLASSIFIERS)
+))
+
+GROUP_CLASSIFIERS = dict(
+    ('g%d' % i, values) for i, (_, values) in enumerate(RE_CLASSIFIERS)
+)
+
+
+class Converter(object):
     """
     A reader for the WELT2000 waypoint file forrmat.
 
     see http://www.segelflug.de/vereine/welt2000/download/WELT2000-SPEC.TXT
     """
 
+    __slots__ = ('fp',)
+
     def __init__(self, fp):
         self.fp = fp
 
@@ -105,9 +129,8 @@ class Converter:
                 waypoint['classifiers'].add('catalogued')
                 waypoint['field_number'] = old['field_number']
 
-        for regex, values in RE_CLASSIFIERS:
-            if regex.search(old['text']):
-                waypoint['classifiers'].update(values)
+        for match in RE_ALL_CLASSIFIERS.finditer(old['text']):
+            waypoint['classifiers'].update(GROUP_CLASSIFIERS[match.lastgroup])
 
         return waypoint
 
@@ -1,17 +1,93 @@
 import re
+from array import array
+from multiprocessing import Pool, cpu_count
 
 from aerofiles.errors import ParserError
 
 
-RE_WHITESPACE = re.compile(r'\s+')
-RE_LATITUDE = re.compile(r'^([NS])([\d]{2})([\d]{2})([\d]{2})$')
-RE_LONGITUDE = re.compile(r'^([EW])([\d]{3})([\d]{2})([\d]{2})$')
-RE_FIELD_NUMBER = re.compile(r'^\*FL([\d]+)$')
-RE_RUNWAY_LENGTH = re.compile(r'^\s*([\d]+)\s*$')
-RE_RUNWAY_DIRECTION = re.compile(r'^\s*([\d]+)\s*$')
-RE_FREQUENCY = re.compile(r'^(1[\d]{2})([\d]{2})$')
+RE_LINE = re.compile(
+    r'^(?P<shortform>\S.{5})'
+    r'(?P<zander_flag>.)'
+    r'(?P<zander>.{12})'
+    r'.{4}'
+    r'(?P<metadata>.)'
+    r'(?P<icao>.{4})'
+    r'(?P<runway_surface>.)'
+    r'(?P<runway_length>.{3})'
+    r'(?P<runway_direction_1>.{2})'
+    r'(?P<runway_direction_2>.{2})'
+    r'(?P<frequency>.{5})'
+    r'(?P<elevation>.{4})'
+    r'(?P<lat_hemisphere>[NS])'
+    r'(?P<lat_degrees>[0-9]{2})(?P<lat_minutes>[0-9]{2})(?P<lat_seconds>[0-9]{2})'
+    r'(?P<lon_hemisphere>[EW])'
+    r'(?P<lon_degrees>[0-9]{3})(?P<lon_minutes>[0-9]{2})(?P<lon_seconds>[0-9]{2})'
+    r'(?P<country>.{2})'
+    r'(?P<year_code>.)'
+    r'(?P<source_code>\S)\r?$',
+    re.DOTALL
+)
+RE_LATITUDE = re.compile(r'^([NS])([0-9]{2})([0-9]{2})([0-9]{2})$')
+RE_LONGITUDE = re.compile(r'^[EW][0-9]{7}$')
+RE_FIELD_NUMBER = re.compile(r'^FL([\d]+)$')
+RE_RUNWAY_NUMBER = re.compile(r'^\s*([\d]+)\s*$')
 RE_ELEVATION = re.compile(r'^[\s]*(-?[\d]+)')
 
+# Glider site markers in columns 19 to 27, matched with RE_GLIDERSITE.match(
+# line, 19) to avoid slicing the line for every possible marker position.
+RE_GLIDERSITE = re.compile(
+    r'GLD #|.GLD[#*]|....(?:# GLD|[#*]GLD)', re.DOTALL)
+
+ULM_MARKERS = frozenset(('*ULM', '#ULM'))
+
+# Lookup tables for the zero-padded digit groups of the coordinates. They are
+# cheaper than converting every group with int() and dividing it again.
+DEGREES = dict(('%02d' % i, i) for i in range(100))
+DEGREES.update(('%03d' % i, i) for i in range(1000))
+MINUTES = dict(('%02d' % i, i / 60.) for i in range(100))
+SECONDS = dict(('%02d' % i, i / 3600.) for i in range(100))
+
+
+def _build_number_table(width, factor):
+    """
+    Map every space padded decimal number of the given column width to its
+    value multiplied by ``factor``.
+    """
+
+    table = {}
+    for digits in range(1, width + 1):
+        for value in range(10 ** digits):
+            number = '%0*d' % (digits, value)
+            for leading in range(width - digits + 1):
+                trailing = width - digits - leading
+                table[' ' * leading + number + ' ' * trailing] = value * factor
+
+    return table
+
+
+# Runway lengths and directions are given in tens of meters and degrees.
+RUNWAY_LENGTHS = _build_number_table(3, 10)
+RUNWAY_DIRECTIONS = _build_number_table(2, 10)
+
+# Frequencies are given as MHz and tens of kHz (e.g. 13012 for 130.125). The
+# omitted last digit is 5 for the 25 kHz channels ending in 2 or 7.
+FREQUENCIES = dict(
+    ('%03d%02d' % (mhz, khz), '%03d.%02d%s' % (
+        mhz, khz, '5' if khz % 10 == 2 or khz % 10 == 7 else '0'))
+    for mhz in range(100, 200) for khz in range(100)
+)
+
+# Country codes for every pair of uppercase letters or spaces, mapped to the
+# stripped code. Looking the raw column up returns the same string object for
+# every waypoint of a country instead of a new copy per line.
+COUNTRY_CHARACTERS = ' ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+COUNTRIES = dict(
+    (a + b, (a + b).strip())
+    for a in COUNTRY_CHARACTERS for b in COUNTRY_CHARACTERS
+)
+
+NAN = float('nan')
+
 SURFACES = {
     'A': 'asphalt',
     'C': 'concrete',
@@ -25,13 +101,15 @@ SURFACES = {
 }
 
 
-class Reader:
+class Reader(object):
     """
     A reader for the WELT2000 waypoint file format.
 
     see http://www.segelflug.de/vereine/welt2000/download/WELT2000-SPEC.TXT
     """
 
+    __slots__ = ('fp',)
+
     def __init__(self, fp=None):
         self.fp = fp
 
@@ -44,190 +122,306 @@ class Reader:
             if wp:
                 yield wp
 
-    def decode_waypoint(self, line):
-        line = line.strip()
+    def read_parallel(self, processes=None):
+        """
+        Read all waypoints with a pool of worker processes and return them as
+        a list in file order::
+
+            if __name__ == '__main__':
+                with open('WELT2000.TXT') as fp:
+                    waypoints = Reader(fp).read_parallel()
+
+        The lines are independent of each other, so they are split into one
+        chunk per process and decoded in parallel. This only pays off for
+        large files, since the waypoints have to be transferred back from the
+        worker processes.
+
+        The workers decode the lines with ``decode_waypoint()`` of the class
+        of this reader, so a subclass that overrides it has to be importable
+        from a module and has to be constructible without arguments, since
+        every worker creates its own instance of it. On platforms that start the workers by spawning a new
+        interpreter (Windows, and macOS since Python 3.8) the main module is
+        imported again in every worker, so the call has to be guarded by
+        ``if __name__ == '__main__':`` as shown above.
+
+        :param processes: the number of worker processes, defaults to the
+            number of CPUs
+        """
+
+        lines = list(self.fp)
+
+        processes = processes or cpu_count()
+        chunk_size = max(1, -(-len(lines) // processes))
+        chunks = [
+            lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)
+        ]
+
+        pool = Pool(processes)
+        try:
+            results = pool.map(
+                _decode_lines, [(type(self), chunk) for chunk in chunks])
+        finally:
+            pool.close()
+            pool.join()
+
+        return [wp for chunk in results for wp in chunk]
+
+    def read_all(self):
+        """
+        Read all waypoints into columns instead of one dictionary per
+        waypoint::
+
+            with open('WELT2000.TXT') as fp:
+                columns = Reader(fp).read_all()
+
+            columns['latitude'][0]  # latitude of the first waypoint
+
+        The ``latitude``, ``longitude`` and ``elevation`` columns are
+        contiguous :class:`array.array` buffers of doubles, which are
+        considerably smaller than lists of float objects and can be wrapped
+        without copying (e.g. by ``numpy.frombuffer()``). Missing elevations
+        are stored as ``nan``. The ``shortform``, ``text`` and ``country``
+        columns are plain lists of strings.
+        """
+
+        shortforms = []
+        texts = []
+        countries = []
+        latitudes = array('d')
+        longitudes = array('d')
+        elevations = array('d')
+
+        for line in self.fp:
+            match = _match_line(line)
+            if not match:
+                continue
+
+            line = match.string
+            (shortform, _, _, metadata, _, _, _, _, _, _, elevation,
+             lat_hemisphere, lat_degrees, lat_minutes, lat_seconds,
+             lon_hemisphere, lon_degrees, lon_minutes, lon_seconds,
+             country, _, _) = match.groups()
+
+            shortforms.append(shortform)
+            texts.append(decode_text(line, metadata in '#*?'))
+            countries.append(decode_country(country))
+
+            latitudes.append(decode_latitude(
+                lat_hemisphere, lat_degrees, lat_minutes, lat_seconds))
+            longitudes.append(decode_longitude(
+                lon_hemisphere, lon_degrees, lon_minutes, lon_seconds))
 
-        if not line or line.startswith('$'):
+            elevation = decode_elevation(elevation)
+            elevations.append(NAN if elevation is None else elevation)
+
+        return {
+            'shortform': shortforms,
+            'text': texts,
+            'country': countries,
+            'latitude': latitudes,
+            'longitude': longitudes,
+            'elevation': elevations,
+        }
+
+    def decode_waypoint(self, line):
+        match = _match_line(line)
+        if not match:
             return
 
-        # Check valid line length
-        if len(line) != 64:
-            raise ParserError('Line length does not match 64')
+        # The groups are unpacked into local variables in a single step, which
+        # is cheaper than a groupdict() and easier to specialize for the PyPy
+        # JIT than repeated dictionary lookups.
+        line = match.string
+        (shortform, zander_flag, zander, metadata, code, runway_surface,
+         runway_length, runway_direction_1, runway_direction_2, frequency,
+         elevation, lat_hemisphere, lat_degrees, lat_minutes, lat_seconds,
+         lon_hemisphere, lon_degrees, lon_minutes, lon_seconds,
+         country, year_code, source_code) = match.groups()
+
+        # The metadata marker is needed by several fields, so it is looked up
+        # only once.
+        has_metadata = metadata in '#*?'
+
+        if zander_flag == ' ' or zander_flag == '-':
+            shortform_zander = zander.rstrip()
+        else:
+            shortform_zander = zander + zander_flag
+
+        if (metadata == '#' and code[0] != ' ' and
+                code[3] != '?' and code[3] != '!'):
+            icao = code.rstrip()
+        else:
+            icao = None
+
+        field_number = None
+        if metadata == '*':
+            field_match = RE_FIELD_NUMBER.match(code)
+            if field_match:
+                field_number = int(field_match.group(1))
+
+        if has_metadata:
+            runway_surface = SURFACES.get(runway_surface, None)
+            runway_length = decode_runway_number(
+                runway_length, RUNWAY_LENGTHS)
+            runway_directions = decode_runway_directions(
+                runway_direction_1, runway_direction_2)
+            frequency = FREQUENCIES.get(frequency)
+        else:
+            runway_surface = None
+            runway_length = None
+            runway_directions = None
+            frequency = None
 
         return {
-            'shortform': self.decode_shortform(line),
-            'is_airfield': self.decode_is_airfield(line),
-            'is_unclear': self.decode_is_unclear(line),
-            'is_outlanding': self.decode_is_outlanding(line),
-            'shortform_zander': self.decode_shortform_zander(line),
-            'text': self.decode_text(line),
-            'icao': self.decode_icao(line),
-            'is_ulm': self.decode_is_ulm(line),
-            'field_number': self.decode_field_number(line),
-            'is_glidersite': self.decode_is_glidersite(line),
-            'runway_surface': self.decode_runway_surface(line),
-            'runway_length': self.decode_runway_length(line),
-            'runway_directions': self.decode_runway_directions(line),
-            'frequency': self.decode_frequency(line),
-            'elevation': self.decode_elevation(line),
-            'elevation_proved': self.decode_elevation_proved(line),
-            'latitude': self.decode_latitude(line),
-            'longitude': self.decode_longitude(line),
-            'ground_check_necessary': self.decode_ground_check_necessary(line),
-            'better_coordinates': self.decode_better_coordinates(line),
-            'country': self.decode_country(line),
-            'year_code': self.decode_year_code(line),
-            'source_code': self.decode_source_code(line),
+            'shortform': shortform,
+            'is_airfield': line[5] == '1',
+            'is_unclear': line[4] == '2',
+            'is_outlanding': line[5] == '2',
+            'shortform_zander': shortform_zander,
+            'text': decode_text(line, has_metadata),
+            'icao': icao,
+            'is_ulm': line[23:27] in ULM_MARKERS or line[23:28] == '# ULM',
+            'field_number': field_number,
+            'is_glidersite': RE_GLIDERSITE.match(line, 19) is not None,
+            'runway_surface': runway_surface,
+            'runway_length': runway_length,
+            'runway_directions': runway_directions,
+            'frequency': frequency,
+            'elevation': decode_elevation(elevation),
+            'elevation_proved': line[41] == '0',
+            'latitude': decode_latitude(
+                lat_hemisphere, lat_degrees, lat_minutes, lat_seconds),
+            'longitude': decode_longitude(
+                lon_hemisphere, lon_degrees, lon_minutes, lon_seconds),
+            # The '?' marker is appended to the free text, so it has no fixed
+            # column. A substring search over the whole line is also faster
+            # than comparing a few single characters.
+            'ground_check_necessary': '?' in line,
+            'better_coordinates': zander_flag == '-',
+            'country': decode_country(country),
+            'year_code': year_code.strip(),
+            'source_code': source_code,
         }
 
-    def has_metadata(self, line):
-        return line[23] == '#' or line[23] == '*' or line[23] == '?'
 
-    def decode_shortform(self, line):
-        return line[0:6]
+def _decode_lines(args):
+    cls, lines = args
+    decode_waypoint = cls().decode_waypoint
+    return [wp for wp in map(decode_waypoint, lines) if wp]
 
-    def decode_is_airfield(self, line):
-        return line[5] == '1'
 
-    def decode_is_unclear(self, line):
-        return line[4] == '2'
+def _match_line(line):
+    if line.startswith('$'):
+        return
 
-    def decode_is_outlanding(self, line):
-        return line[5] == '2'
+    # Well-formed lines are matched including their line break, which RE_LINE
+    # allows for, so that they don't have to be copied by strip() first.
+    match = RE_LINE.match(line)
+    if match:
+        return match
 
-    def decode_shortform_zander(self, line):
-        if line[6] == ' ' or line[6] == '-':
-            return line[7:19].rstrip()
-        else:
-            return line[7:19] + line[6]
+    line = line.strip()
+    if not line or line.startswith('$'):
+        return
 
-    def decode_text(self, line):
-        if not self.has_metadata(line):
-            return line[7:41].rstrip('?! ')
-        elif line[20:23] == 'GLD':
-            return line[7:20].rstrip('?! ')
-        else:
-            return line[7:23].rstrip('?! ')
-
-    def decode_icao(self, line):
-        if (line[23] == '#' and line[24] != ' ' and
-                line[27] != '?' and line[27] != '!'):
-            return line[24:28].rstrip()
-
-    def decode_is_ulm(self, line):
-        return (
-            line[23:27] == '*ULM' or
-            line[23:27] == '#ULM' or
-            line[23:28] == '# ULM'
-        )
-
-    def decode_field_number(self, line):
-        match = RE_FIELD_NUMBER.match(line[23:28])
-        if match:
-            return int(match.group(1))
-
-    def decode_is_glidersite(self, line):
-        return (
-            line[23:28] == '# GLD' or
-            line[23:27] == '#GLD' or
-            line[23:27] == '*GLD' or
-            line[19:24] == 'GLD #' or
-            line[20:24] == 'GLD#' or
-            line[20:24] == 'GLD*'
-        )
-
-    def decode_runway_surface(self, line):
-        if self.has_metadata(line):
-            return SURFACES.get(line[28], None)
-
-    def decode_runway_length(self, line):
-        if self.has_metadata(line):
-            match = RE_RUNWAY_LENGTH.match(line[29:32])
-            if match:
-                return int(match.group(1)) * 10
-
-    def decode_runway_directions(self, line):
-        if self.has_metadata(line):
-            directions = []
-
-            match = RE_RUNWAY_DIRECTION.match(line[32:34])
-            if match:
-                direction = int(match.group(1)) * 10
-                directions.append(direction)
-
-            match = RE_RUNWAY_DIRECTION.match(line[34:36])
-            if match:
-                direction = int(match.group(1)) * 10
-                if direction not in directions:
-                    directions.append(direction)
-
-            return directions or None
-
-    def decode_frequency(self, line):
-        if self.has_metadata(line):
-            match = RE_FREQUENCY.match(line[36:41])
-            if match:
-                frq = match.group(1) + '.' + match.group(2)
-                frq += '5' if frq.endswith('2') or frq.endswith('7') else '0'
-                return frq
-
-    def decode_elevation(self, line):
-        match = RE_ELEVATION.match(line[41:45])
+    # Check valid line length
+    if len(line) != 64:
+        raise ParserError('Line length does not match 64')
+
+    # All fixed-column fields are extracted in a single regex pass. The
+    # fields between are free text, so the match can only fail on the
+    # strictly formatted coordinates. The first invalid coordinate is
+    # reported in the same order in which they are decoded.
+    match = RE_LINE.match(line)
+    if not match:
+        latitude = RE_LATITUDE.match(line[45:52])
+        if not latitude:
+            raise ParserError('Reading latitude failed')
+
+        decode_latitude(*latitude.groups())
+
+        if not RE_LONGITUDE.match(line[52:60]):
+            raise ParserError('Reading longitude failed')
+
+        raise ParserError('Line does not match the WELT2000 format')
+
+    return match
+
+
+def decode_text(line, has_metadata):
+    if not has_metadata:
+        return line[7:41].rstrip('?! ')
+    elif line[20:23] == 'GLD':
+        return line[7:20].rstrip('?! ')
+    else:
+        return line[7:23].rstrip('?! ')
+
+
+def decode_country(value):
+    return COUNTRIES.get(value) or value.strip()
+
+
+def decode_runway_number(value, table):
+    # The table only covers numbers padded with spaces. Other whitespace
+    # (e.g. tabs) falls back to the regex, blank values are always None.
+    number = table.get(value)
+    if number is None and not value.isspace():
+        match = RE_RUNWAY_NUMBER.match(value)
         if match:
-            return int(match.group(1))
+            number = int(match.group(1)) * 10
 
-    def decode_elevation_proved(self, line):
-        return line[41] == '0'
+    return number
 
-    def decode_latitude(self, line):
-        match = RE_LATITUDE.match(line[45:52])
-        if not match:
-            raise ParserError('Reading latitude failed')
 
-        lat = (
-            int(match.group(2)) +
-            int(match.group(3)) / 60. +
-            int(match.group(4)) / 3600.
-        )
+def decode_runway_directions(value1, value2):
+    directions = []
 
-        if not (0 <= lat <= 90):
-            raise ParserError('Latitude out of bounds')
+    direction = decode_runway_number(value1, RUNWAY_DIRECTIONS)
+    if direction is not None:
+        directions.append(direction)
 
-        if match.group(1) == 'S':
-            lat = -lat
+    direction = decode_runway_number(value2, RUNWAY_DIRECTIONS)
+    if direction is not None and direction not in directions:
+        directions.append(direction)
 
-        return lat
+    return directions or None
+
+
+def decode_elevation(value):
+    # Almost all elevations are space padded integers, which int() converts
+    # directly and much faster than the regex. int() also accepts signs and
+    # underscores that the regex doesn't, so only values of the regex's shape
+    # take this path.
+    if value.lstrip(' ').lstrip('-').isdigit():
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+    match = RE_ELEVATION.match(value)
+    if match:
+        return int(match.group(1))
 
-    def decode_longitude(self, line):
-        match = RE_LONGITUDE.match(line[52:60])
-        if not match:
-            raise ParserError('Reading longitude failed')
 
-        lon = (
-            int(match.group(2)) +
-            int(match.group(3)) / 60. +
-            int(match.group(4)) / 3600.
-        )
+def decode_latitude(hemisphere, degrees, minutes, seconds):
+    lat = DEGREES[degrees] + MINUTES[minutes] + SECONDS[seconds]
 
-        if not (0 <= lon <= 180):
-            raise ParserError('Longitude out of bounds')
+    if not (0 <= lat <= 90):
+        raise ParserError('Latitude out of bounds')
 
-        if match.group(1) == 'W':
-            lon = -lon
+    if hemisphere == 'S':
+        lat = -lat
 
-        return lon
+    return lat
 
-    def decode_ground_check_necessary(self, line):
-        return '?' in line
 
-    def decode_better_coordinates(self, line):
-        return line[6] == '-'
+def decode_longitude(hemisphere, degrees, minutes, seconds):
+    lon = DEGREES[degrees] + MINUTES[minutes] + SECONDS[seconds]
 
-    def decode_country(self, line):
-        return line[60:62].strip()
+    if not (0 <= lon <= 180):
+        raise ParserError('Longitude out of bounds')
 
-    def decode_year_code(self, line):
-        return line[62].strip()
+    if hemisphere == 'W':
+        lon = -lon
 
-    def decode_source_code(self, line):
-        return line[63].strip()
+    return lon
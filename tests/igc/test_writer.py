@@ -23,6 +23,17 @@ def test_write_line(writer):
     assert writer.fp.getvalue() == b'line\r\n'
 
 
+def test_write_line_interleaved(output, writer):
+    assert writer.fp is output
+
+    output.write(b'before\r\n')
+    writer.write_line('line')
+    output.write(b'after\r\n')
+    writer.write_line('line')
+
+    assert output.getvalue() == b'before\r\nline\r\nafter\r\nline\r\n'
+
+
 @pytest.fixture(params=['XXX', 'GCS', 'FIL', 'FLA'])
 def manufacturer_code(request):
     return request.param
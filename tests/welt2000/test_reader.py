@@ -2,8 +2,15 @@ from os import path
 
 import pytest
 
+from aerofiles.errors import ParserError
 from aerofiles.welt2000 import Reader, Converter
-from aerofiles.welt2000.reader import SURFACES
+from aerofiles.welt2000.reader import (
+    SURFACES, RUNWAY_LENGTHS, RUNWAY_DIRECTIONS,
+    decode_country, decode_elevation, decode_runway_number
+)
+from aerofiles.welt2000.converter import (
+    RE_CLASSIFIERS, RE_ALL_CLASSIFIERS, GROUP_CLASSIFIERS
+)
 
 from tests import assert_waypoint
 
@@ -217,6 +224,31 @@ WAYPOINTS = [
         'year_code': 'Q',
         'source_code': '4',
     }),
+    ('CERE21 CERES4 WRONG   ?#SANWC13505021      88S295147W0615222ARQ0', {
+        'shortform': 'CERE21',
+        'is_airfield': True,
+        'is_unclear': True,
+        'is_outlanding': False,
+        'shortform_zander': 'CERES4 WRONG',
+        'text': 'CERES4 WRONG',
+        'icao': 'SANW',
+        'is_ulm': False,
+        'field_number': None,
+        'is_glidersite': False,
+        'runway_surface': 'concrete',
+        'runway_length': 1350,
+        'runway_directions': [50, 20],
+        'frequency': None,
+        'elevation': 88,
+        'elevation_proved': False,
+        'latitude': -29.863055555555558,
+        'longitude': -61.87277777777778,
+        'ground_check_necessary': True,
+        'better_coordinates': False,
+        'country': 'AR',
+        'year_code': 'Q',
+        'source_code': '0',
+    }),
 ]
 
 
@@ -237,6 +269,134 @@ def test_parse_waypoint(waypoint):
     assert_waypoint(waypoints[0], waypoint[1])
 
 
+def test_decode_elevation():
+    assert decode_elevation(' 164') == 164
+    assert decode_elevation('1234') == 1234
+    assert decode_elevation('  -5') == -5
+    assert decode_elevation(' 12?') == 12
+    assert decode_elevation('    ') is None
+    assert decode_elevation('+140') is None
+    assert decode_elevation('9_4 ') == 9
+    assert decode_elevation(' 1\xb2 ') == 1
+
+
+def test_parse_waypoint_with_inner_line_break():
+    line = 'MANOSQ MANOSQUE PONT D907X\nURANCE         295N434816E0054928FRQ0'
+    waypoints = list(Reader([line]))
+    assert len(waypoints) == 1
+    assert waypoints[0]['text'] == 'MANOSQUE PONT D907X\nURANCE'
+
+
+def test_glidersite_after_line_break():
+    line = WAYPOINTS[0][0]
+    line = line[:19] + '\nGLD#' + line[24:]
+    waypoints = list(Reader([line]))
+    assert len(waypoints) == 1
+    assert waypoints[0]['is_glidersite']
+
+
+def test_field_number_with_non_ascii_digit():
+    line = 'MARCO2 MARCOUX CHAMP 8!*FL1\xb2S 2513131     694N440739E0061714FRP0'
+    waypoints = list(Reader([line]))
+    assert len(waypoints) == 1
+    assert waypoints[0]['field_number'] is None
+
+
+@pytest.mark.parametrize('line, message', [
+    ('MEIER1 MEIERSBERG      #GLD!G 80133113012 164X511759E0065723DEP0',
+     'Reading latitude failed'),
+    ('MEIER1 MEIERSBERG      #GLD!G 80133113012 164N51175XE0065723DEP0',
+     'Reading latitude failed'),
+    ('MEIER1 MEIERSBERG      #GLD!G 80133113012 164N511759X0065723DEP0',
+     'Reading longitude failed'),
+    ('MEIER1 MEIERSBERG      #GLD!G 80133113012 164N511759E006572XDEP0',
+     'Reading longitude failed'),
+    ('MEIER1 MEIERSBERG      #GLD!G 80133113012 164N951759E0065723DEP0',
+     'Latitude out of bounds'),
+    ('MEIER1 MEIERSBERG      #GLD!G 80133113012 164N951759E006572XDEP0',
+     'Latitude out of bounds'),
+    ('MEIER1 MEIERSBERG      #GLD!G 80133113012 164N511759E1865723DEP0',
+     'Longitude out of bounds'),
+])
+def test_invalid_coordinates(line, message):
+    with pytest.raises(ParserError) as ex:
+        list(Reader([line]))
+
+    assert message in str(ex.value)
+
+
+def test_decode_runway_number():
+    assert decode_runway_number('080', RUNWAY_LENGTHS) == 800
+    assert decode_runway_number(' 80', RUNWAY_LENGTHS) == 800
+    assert decode_runway_number('8  ', RUNWAY_LENGTHS) == 80
+    assert decode_runway_number(' \t4', RUNWAY_LENGTHS) == 40
+    assert decode_runway_number('   ', RUNWAY_LENGTHS) is None
+    assert decode_runway_number('8A ', RUNWAY_LENGTHS) is None
+    assert decode_runway_number('13', RUNWAY_DIRECTIONS) == 130
+    assert decode_runway_number('\r1', RUNWAY_DIRECTIONS) == 10
+    assert decode_runway_number(' \t', RUNWAY_DIRECTIONS) is None
+
+
+def test_decode_country():
+    assert decode_country('DE') == 'DE'
+    assert decode_country('D ') == 'D'
+    assert decode_country('  ') == ''
+    assert decode_country('d1') == 'd1'
+
+    first, second = ''.join(['D', 'E']), ''.join(['D', 'E'])
+    assert first is not second
+    assert decode_country(first) is decode_country(second)
+
+
+def test_read_parallel():
+    lines = ['$ this is a comment'] + [line for line, _ in WAYPOINTS]
+    waypoints = Reader(lines).read_parallel(processes=2)
+    assert waypoints == list(Reader(lines))
+
+
+class LowerCaseTextReader(Reader):
+    def decode_waypoint(self, line):
+        waypoint = super(LowerCaseTextReader, self).decode_waypoint(line)
+        if waypoint:
+            waypoint['text'] = waypoint['text'].lower()
+            return waypoint
+
+
+def test_read_parallel_subclass():
+    lines = [line for line, _ in WAYPOINTS]
+    waypoints = LowerCaseTextReader(lines).read_parallel(processes=2)
+    assert waypoints == list(LowerCaseTextReader(lines))
+    assert waypoints[0]['text'] == 'meiersberg'
+
+
+def test_read_all():
+    columns = Reader([line for line, _ in WAYPOINTS]).read_all()
+
+    for key in ('shortform', 'text', 'country', 'latitude', 'longitude',
+                'elevation'):
+        assert len(columns[key]) == len(WAYPOINTS)
+
+    for i, (_, expected) in enumerate(WAYPOINTS):
+        assert columns['shortform'][i] == expected['shortform']
+        assert columns['text'][i] == expected['text']
+        assert columns['country'][i] == expected['country']
+        assert columns['elevation'][i] == expected['elevation']
+        assert abs(columns['latitude'][i] - expected['latitude']) < 0.00001
+        assert abs(columns['longitude'][i] - expected['longitude']) < 0.00001
+
+
+def test_read_all_comments():
+    columns = Reader(['$ this is a comment']).read_all()
+    assert len(columns['latitude']) == 0
+
+
+@pytest.mark.parametrize('suffix', ['\n', '\r\n', ' \n', '\r'])
+def test_parse_waypoint_with_line_break(waypoint, suffix):
+    waypoints = list(Reader([waypoint[0] + suffix]))
+    assert len(waypoints) == 1
+    assert_waypoint(waypoints[0], waypoint[1])
+
+
 @if_data_available
 def test_base_original():
     with open(DATA_PATH) as f:
@@ -251,6 +411,33 @@ def test_original():
             check_waypoint(waypoint)
 
 
+@if_data_available
+def test_original_parallel():
+    with open(DATA_PATH) as f:
+        waypoints = list(Reader(f))
+
+    with open(DATA_PATH) as f:
+        assert Reader(f).read_parallel(processes=4) == waypoints
+
+
+@if_data_available
+def test_combined_classifiers():
+    with open(DATA_PATH) as f:
+        for waypoint in Reader(f):
+            text = waypoint['text']
+
+            expected = set()
+            for regex, values in RE_CLASSIFIERS:
+                if regex.search(text):
+                    expected.update(values)
+
+            classifiers = set()
+            for match in RE_ALL_CLASSIFIERS.finditer(text):
+                classifiers.update(GROUP_CLASSIFIERS[match.lastgroup])
+
+            assert classifiers == expected
+
+
 def check_waypoint(waypoint):
     # Check name
     assert 'name' in waypoint